@@ -60,6 +60,9 @@ class GovernanceValidator:
         r"sk-[A-Za-z0-9]{48}",  # OpenAI API Key
     ]
 
+    # Compiled once at class load; check_secrets reuses these per PR
+    SECRET_REGEXES = [re.compile(p, re.IGNORECASE) for p in SECRET_PATTERNS]
+
     ALLOWED_COCKPIT_PATHS = [
         "COCKPIT/artifacts/",
         "COCKPIT/WORKSPACE/TEAM_LOG.md",
@@ -276,8 +279,8 @@ class GovernanceValidator:
     # =========================================================================
     def check_secrets(self):
         """Detect potential secrets in PR description."""
-        for pattern in self.SECRET_PATTERNS:
-            match = re.search(pattern, self.pr_description, re.IGNORECASE)
+        for regex in self.SECRET_REGEXES:
+            match = regex.search(self.pr_description)
             if match:
                 # Redact the match for safety
                 redacted = match.group(0)[:20] + "..."